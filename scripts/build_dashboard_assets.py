@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import ast
-import base64
+import binascii
 import html
 import json
+import os
 import re
 import shutil
+import string
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speed-up
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -24,7 +36,84 @@ PROFILE_PATH_CANDIDATES = [
 ]
 
 
-NON_ASCII = re.compile(r"[^\x00-\x7F]+")
+TAG_RE = re.compile(r"<[^>]+>")
+SIZE_RE = re.compile(r"^([\d.]+)\s*([KMGT]?i?B)$", re.I)
+SIZE_FACTORS = {
+    "B": 1,
+    "KIB": 1024,
+    "MIB": 1024**2,
+    "GIB": 1024**3,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+}
+
+SHAPE_RE = re.compile(r"Shape:\s*([\d,]+)\s*rows.*?([\d,]+)\s*columns", re.S)
+NUMERIC_FEATURES_RE = re.compile(r"Numerical features \((\d+)\)")
+CATEGORICAL_FEATURES_RE = re.compile(r"Categorical features \((\d+)\)")
+TARGET_STATS_RE = re.compile(
+    r"Mean\s*:\s*(?P<mean>[\d,\.]+)"
+    r"|Median\s*:\s*(?P<median>[\d,\.]+)"
+    r"|Skewness\s*:\s*(?P<skew>[\d,\.]+)"
+    r"|Kurtosis\s*:\s*(?P<kurt>[\d,\.]+)"
+)
+TARGET_STATS_KEYS = {
+    "mean": "mean_saleprice",
+    "median": "median_saleprice",
+    "skew": "saleprice_skew",
+    "kurt": "saleprice_kurtosis",
+}
+IQR_BOUNDS_RE = re.compile(
+    r"Q1\s*:\s*(?P<q1>[\d,\.]+)"
+    r"|Q3\s*:\s*(?P<q3>[\d,\.]+)"
+    r"|IQR\s*:\s*(?P<iqr>[\d,\.]+)"
+    r"|Lower bound:\s*(?P<lower>[\d,\.]+)"
+    r"|Upper bound:\s*(?P<upper>[\d,\.]+)"
+)
+IQR_BOUNDS_KEYS = {
+    "q1": "q1",
+    "q3": "q3",
+    "iqr": "iqr_value",
+    "lower": "iqr_lower_bound",
+    "upper": "iqr_upper_bound",
+}
+IQR_ROW_COUNTS_RE = re.compile(
+    r"Rows before IQR filtering\s*:\s*(?P<before>[\d,]+)"
+    r"|Rows after IQR filtering\s*:\s*(?P<after>[\d,]+)"
+    r"|Rows removed as outliers\s*:\s*(?P<removed>[\d,]+)"
+    r"|% removed:\s*(?P<removed_pct>[\d\.]+)"
+)
+IQR_ROW_COUNTS_KEYS = {
+    "before": "rows_before_iqr",
+    "after": "rows_after_iqr",
+    "removed": "rows_removed_iqr",
+    "removed_pct": "rows_removed_pct_iqr",
+}
+FEATURE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+TR_RE = re.compile(r"<tr><th>(.*?)<td[^>]*>(.*?)(?=<tr>|$)", re.S)
+ALERT_RE = re.compile(
+    r"<tr><td><a href=#pp_var_[^>]+><code>(.*?)</code></a>\s*(.*?)<td><span class=\"badge [^\"]+\">(.*?)</span>",
+    re.S,
+)
+ALERT_MSG_RE = re.compile(
+    r"has\s+(?P<count>[\d,]+)\s+\((?P<pct>[\d\.]+)%\)\s+(?P<kind>missing values|zeros)"
+)
+IMBALANCE_ALERT_RE = re.compile(r"\((?P<pct>[\d\.]+)%\)")
+META_DATE_RE = re.compile(r"<meta content=\"([^\"]+)\" name=date>")
+STATS_BLOCK_RE = re.compile(
+    r"Dataset statistics<table class=\"table table-striped\"><tbody>(.*?)</table>", re.S
+)
+TYPES_BLOCK_RE = re.compile(
+    r"Variable types<table class=\"table table-striped\"><tbody>(.*?)</table>", re.S
+)
+ALERT_COUNT_RE = re.compile(
+    r"Alerts <span class=\"badge text-bg-secondary align-text-top\">(\d+)</span>"
+)
+ALERT_TABLE_RE = re.compile(
+    r"<p class=\"h4 item-header\">Alerts</p>(.*?)</table></div></div></div><div class=\"tab-pane fade\" aria-labelledby=tab-pane-overview-reproduction",
+    re.S,
+)
 
 
 CHART_CELL_MAP: dict[int, str] = {
@@ -40,6 +129,10 @@ CHART_CELL_MAP: dict[int, str] = {
     43: "overallqual_vs_log_saleprice.png",
     48: "top15_neighborhood_mean.png",
 }
+METRIC_CELL_INDICES = (7, 11, 13, 21, 23, 27, 33, 35, 46, 47)
+WANTED_CELL_INDICES = frozenset(CHART_CELL_MAP) | frozenset(METRIC_CELL_INDICES)
+PNG_WRITE_BUFFER_SIZE = 1024 * 1024
+BASE64_BLOCK_CHARS = 64 * 1024
 
 
 def ensure_dirs() -> None:
@@ -54,9 +147,38 @@ def find_profile_path() -> Path | None:
     return None
 
 
-def load_notebook(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+def iter_needed_cells(
+    path: Path, wanted_indices: Iterable[int]
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    wanted = set(wanted_indices)
+    if not wanted:
+        return
+    last_index = max(wanted)
+    if ijson is None:
+        with path.open("r", encoding="utf-8") as file:
+            cells = json.load(file)["cells"]
+        for index in sorted(wanted):
+            if index < len(cells):
+                yield index, cells[index]
+        return
+
+    with path.open("rb") as file:
+        for index, cell in enumerate(ijson.items(file, "cells.item", use_float=True)):
+            if index in wanted:
+                yield index, cell
+            if index >= last_index:
+                break
+
+
+def load_notebook_cells(path: Path, wanted_indices: Iterable[int]) -> dict[int, dict[str, Any]]:
+    wanted = set(wanted_indices)
+    cells = dict(iter_needed_cells(path, wanted))
+    missing = sorted(wanted - cells.keys())
+    if missing:
+        raise ValueError(
+            f"Notebook {path.name} is missing expected cells: {', '.join(map(str, missing))}"
+        )
+    return cells
 
 
 def load_text(path: Path) -> str:
@@ -64,19 +186,26 @@ def load_text(path: Path) -> str:
 
 
 def normalize_text(text: str) -> str:
-    return NON_ASCII.sub("", text)
+    return text.encode("ascii", "ignore").decode("ascii")
 
 
 def as_text(value: Any) -> str:
-    if isinstance(value, list):
-        return "".join(str(item) for item in value)
+    # nbformat stores multiline text as list[str]; only coerce items when it doesn't.
+    if type(value) is list:
+        if all(type(item) is str for item in value):
+            return "".join(value)
+        return "".join(map(str, value))
+    if type(value) is str:
+        return value
     return str(value)
 
 
 def strip_tags(text: str) -> str:
-    text = re.sub(r"<[^>]+>", "", text)
-    text = html.unescape(text)
-    text = text.replace("\xa0", " ")
+    if "<" in text:
+        text = TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    # str.split() already treats non-breaking spaces as whitespace.
     return " ".join(text.split())
 
 
@@ -92,33 +221,34 @@ def parse_number(value: str) -> float | int | None:
         return None
 
 
+def parse_count(value: str) -> float | int | None:
+    # Profile count fields are plain integers; fall back to parse_number otherwise.
+    clean = value.replace(",", "")
+    if clean.isdecimal():
+        return int(clean)
+    return parse_number(value)
+
+
 def parse_size_to_bytes(value: str) -> float | None:
     clean = value.strip().replace(",", "")
-    match = re.match(r"^([\d.]+)\s*([KMGT]?i?B)$", clean, re.I)
+    match = SIZE_RE.match(clean)
     if not match:
         return None
-    amount = float(match.group(1))
-    unit = match.group(2).upper()
-    factor_map = {
-        "B": 1,
-        "KIB": 1024,
-        "MIB": 1024**2,
-        "GIB": 1024**3,
-        "KB": 1000,
-        "MB": 1000**2,
-        "GB": 1000**3,
-    }
-    factor = factor_map.get(unit)
+    factor = SIZE_FACTORS.get(match.group(2).upper())
     if factor is None:
         return None
-    return amount * factor
+    return float(match.group(1)) * factor
 
 
-def get_cell(nb: dict[str, Any], index: int) -> dict[str, Any]:
-    return nb["cells"][index]
+def get_cell(cells: dict[int, dict[str, Any]], index: int) -> dict[str, Any]:
+    try:
+        return cells[index]
+    except KeyError:
+        raise KeyError(f"Notebook cell {index} was not loaded") from None
 
 
 def get_stream_text(cell: dict[str, Any]) -> str:
+    # print() output can be split across several stream outputs, so collect them all.
     chunks: list[str] = []
     for output in cell.get("outputs", []):
         if output.get("output_type") == "stream":
@@ -127,6 +257,7 @@ def get_stream_text(cell: dict[str, Any]) -> str:
 
 
 def get_first_text_plain(cell: dict[str, Any]) -> str:
+    # Stop at the first text/plain payload; later outputs are never inspected.
     for output in cell.get("outputs", []):
         data = output.get("data")
         if isinstance(data, dict) and "text/plain" in data:
@@ -142,21 +273,44 @@ def parse_float(value: str) -> float:
     return float(value.replace(",", "").strip())
 
 
+def is_decimal(value: str) -> bool:
+    if value.startswith("-"):
+        value = value[1:]
+    whole, dot, fraction = value.partition(".")
+    return whole.isdecimal() and (not dot or fraction.isdecimal())
+
+
+def is_grouped_decimal(value: str) -> bool:
+    whole, dot, fraction = value.partition(".")
+    return bool(dot) and fraction.isdecimal() and whole.replace(",", "").isdecimal()
+
+
 def parse_shape(text: str) -> tuple[int | None, int | None]:
-    match = re.search(r"Shape:\s*([\d,]+)\s*rows.*?([\d,]+)\s*columns", text, re.S)
+    match = SHAPE_RE.search(text)
     if not match:
         return None, None
     return parse_int(match.group(1)), parse_int(match.group(2))
 
 
 def parse_feature_counts(text: str) -> tuple[int | None, int | None]:
-    num_match = re.search(r"Numerical features \((\d+)\)", text)
-    cat_match = re.search(r"Categorical features \((\d+)\)", text)
+    num_match = NUMERIC_FEATURES_RE.search(text)
+    cat_match = CATEGORICAL_FEATURES_RE.search(text)
     numeric = int(num_match.group(1)) if num_match else None
     categorical = int(cat_match.group(1)) if cat_match else None
     return numeric, categorical
 
 
+def scan_named_fields(pattern: re.Pattern[str], keys: dict[str, str], text: str) -> dict[str, str]:
+    # Single pass over the text; keeps the first raw value seen for each output key.
+    found: dict[str, str] = {}
+    for match in pattern.finditer(text):
+        group = match.lastgroup
+        if group is None:
+            continue
+        found.setdefault(keys[group], match.group(group))
+    return found
+
+
 def parse_target_stats(text: str) -> dict[str, float | None]:
     values = {
         "mean_saleprice": None,
@@ -164,16 +318,8 @@ def parse_target_stats(text: str) -> dict[str, float | None]:
         "saleprice_skew": None,
         "saleprice_kurtosis": None,
     }
-    patterns = {
-        "mean_saleprice": r"Mean\s*:\s*([\d,\.]+)",
-        "median_saleprice": r"Median\s*:\s*([\d,\.]+)",
-        "saleprice_skew": r"Skewness\s*:\s*([\d,\.]+)",
-        "saleprice_kurtosis": r"Kurtosis\s*:\s*([\d,\.]+)",
-    }
-    for key, pattern in patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            values[key] = parse_float(match.group(1))
+    for key, raw in scan_named_fields(TARGET_STATS_RE, TARGET_STATS_KEYS, text).items():
+        values[key] = parse_float(raw)
     return values
 
 
@@ -185,17 +331,8 @@ def parse_iqr_bounds(text: str) -> dict[str, float | None]:
         "iqr_lower_bound": None,
         "iqr_upper_bound": None,
     }
-    patterns = {
-        "q1": r"Q1\s*:\s*([\d,\.]+)",
-        "q3": r"Q3\s*:\s*([\d,\.]+)",
-        "iqr_value": r"IQR\s*:\s*([\d,\.]+)",
-        "iqr_lower_bound": r"Lower bound:\s*([\d,\.]+)",
-        "iqr_upper_bound": r"Upper bound:\s*([\d,\.]+)",
-    }
-    for key, pattern in patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            values[key] = parse_float(match.group(1))
+    for key, raw in scan_named_fields(IQR_BOUNDS_RE, IQR_BOUNDS_KEYS, text).items():
+        values[key] = parse_float(raw)
     return values
 
 
@@ -206,34 +343,26 @@ def parse_iqr_row_counts(text: str) -> dict[str, float | int | None]:
         "rows_removed_iqr": None,
         "rows_removed_pct_iqr": None,
     }
-    patterns = {
-        "rows_before_iqr": r"Rows before IQR filtering\s*:\s*([\d,]+)",
-        "rows_after_iqr": r"Rows after IQR filtering\s*:\s*([\d,]+)",
-        "rows_removed_iqr": r"Rows removed as outliers\s*:\s*([\d,]+)",
-        "rows_removed_pct_iqr": r"% removed:\s*([\d\.]+)",
-    }
-    for key, pattern in patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            if key == "rows_removed_pct_iqr":
-                values[key] = parse_float(match.group(1))
-            else:
-                values[key] = parse_int(match.group(1))
+    for key, raw in scan_named_fields(IQR_ROW_COUNTS_RE, IQR_ROW_COUNTS_KEYS, text).items():
+        if key == "rows_removed_pct_iqr":
+            values[key] = parse_float(raw)
+        else:
+            values[key] = parse_int(raw)
     return values
 
 
 def parse_correlation_table(text: str) -> list[dict[str, float | str]]:
     rows: list[dict[str, float | str]] = []
     for raw in text.splitlines():
-        line = raw.rstrip()
+        line = raw.strip()
         if not line or "Correlation with SalePrice" in line:
             continue
-        match = re.match(r"^(.+?)\s+(-?\d+(?:\.\d+)?)$", line.strip())
-        if match:
+        parts = line.rsplit(None, 1)
+        if len(parts) == 2 and is_decimal(parts[1]):
             rows.append(
                 {
-                    "feature": match.group(1).strip(),
-                    "correlation": parse_float(match.group(2)),
+                    "feature": parts[0],
+                    "correlation": parse_float(parts[1]),
                 }
             )
     return rows
@@ -256,17 +385,19 @@ def parse_neighborhood_table(text: str) -> list[dict[str, float | int | str]]:
         line = raw.strip()
         if not line or line.startswith("mean") or line.startswith("Neighborhood"):
             continue
-        match = re.match(
-            r"^(\S+)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)\s+(\d+)$",
-            line,
-        )
-        if match:
+        parts = line.split()
+        if (
+            len(parts) == 4
+            and parts[3].isdecimal()
+            and is_grouped_decimal(parts[1])
+            and is_grouped_decimal(parts[2])
+        ):
             rows.append(
                 {
-                    "neighborhood": match.group(1),
-                    "mean_saleprice": parse_float(match.group(2)),
-                    "median_saleprice": parse_float(match.group(3)),
-                    "count": int(match.group(4)),
+                    "neighborhood": parts[0],
+                    "mean_saleprice": parse_float(parts[1]),
+                    "median_saleprice": parse_float(parts[2]),
+                    "count": int(parts[3]),
                 }
             )
     return rows
@@ -280,15 +411,15 @@ def parse_missing_table(
         line = raw.strip()
         if not line or line.startswith("dtype:"):
             continue
-        match = re.match(r"^([A-Za-z0-9_]+)\s+(\d+)$", line)
-        if match:
-            count = int(match.group(2))
+        parts = line.split()
+        if len(parts) == 2 and parts[1].isdecimal() and FEATURE_NAME_CHARS.issuperset(parts[0]):
+            count = int(parts[1])
             missing_pct = None
             if rows_after_iqr and rows_after_iqr > 0:
                 missing_pct = round((count / rows_after_iqr) * 100, 2)
             rows.append(
                 {
-                    "feature": match.group(1),
+                    "feature": parts[0],
                     "missing_count": count,
                     "missing_pct": missing_pct,
                 }
@@ -296,23 +427,45 @@ def parse_missing_table(
     return rows
 
 
-def extract_png_from_cell(cell: dict[str, Any]) -> bytes | None:
+def iter_base64_blocks(encoded: str | list[str]) -> Iterator[str]:
+    pieces = (encoded,) if isinstance(encoded, str) else encoded
+    pending = ""
+    for piece in pieces:
+        for start in range(0, len(piece), BASE64_BLOCK_CHARS):
+            pending += "".join(piece[start : start + BASE64_BLOCK_CHARS].split())
+            usable = len(pending) - len(pending) % 4
+            if usable:
+                yield pending[:usable]
+                pending = pending[usable:]
+    if pending:
+        yield pending
+
+
+def write_png_from_cell(cell: dict[str, Any], path: Path) -> bool:
+    # Each chart cell renders a single figure, so the first image/png output wins.
     for output in cell.get("outputs", []):
         data = output.get("data")
         if isinstance(data, dict) and "image/png" in data:
-            encoded = as_text(data["image/png"]).replace("\n", "")
-            return base64.b64decode(encoded)
-    return None
-
-
-def export_charts(nb: dict[str, Any]) -> dict[str, str]:
+            # Decode into a sibling temp file so a bad payload never clobbers an existing chart.
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            try:
+                with tmp_path.open("wb", buffering=PNG_WRITE_BUFFER_SIZE) as file:
+                    for block in iter_base64_blocks(data["image/png"]):
+                        file.write(binascii.a2b_base64(block))
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            return True
+    return False
+
+
+def export_charts(cells: dict[int, dict[str, Any]]) -> dict[str, str]:
     chart_files: dict[str, str] = {}
     for cell_index, filename in CHART_CELL_MAP.items():
-        image_bytes = extract_png_from_cell(get_cell(nb, cell_index))
-        if image_bytes is None:
-            continue
         output_path = CHARTS_DIR / filename
-        output_path.write_bytes(image_bytes)
+        if not write_png_from_cell(get_cell(cells, cell_index), output_path):
+            continue
         chart_files[filename.replace(".png", "")] = f"assets/charts/{filename}"
 
     source_mockup = PROJECT_ROOT / "image.png"
@@ -325,20 +478,17 @@ def export_charts(nb: dict[str, Any]) -> dict[str, str]:
 
 def parse_table_rows_from_block(block: str) -> dict[str, str]:
     rows: dict[str, str] = {}
-    for key_html, val_html in re.findall(r"<tr><th>(.*?)<td[^>]*>(.*?)(?=<tr>|$)", block, re.S):
+    for match in TR_RE.finditer(block):
+        key_html, val_html = match.groups()
         key = strip_tags(key_html).lower().replace(" ", "_").replace("(%)", "pct")
-        value = strip_tags(val_html)
-        rows[key] = value
+        rows[key] = strip_tags(val_html)
     return rows
 
 
 def parse_alert_rows(alert_block: str) -> list[dict[str, Any]]:
     alerts: list[dict[str, Any]] = []
-    pattern = re.compile(
-        r"<tr><td><a href=#pp_var_[^>]+><code>(.*?)</code></a>\s*(.*?)<td><span class=\"badge [^\"]+\">(.*?)</span>",
-        re.S,
-    )
-    for feature_html, message_html, alert_type_html in pattern.findall(alert_block):
+    for match in ALERT_RE.finditer(alert_block):
+        feature_html, message_html, alert_type_html = match.groups()
         feature = strip_tags(feature_html)
         message = strip_tags(message_html)
         alert_type = strip_tags(alert_type_html)
@@ -352,94 +502,88 @@ def parse_alert_rows(alert_block: str) -> list[dict[str, Any]]:
     return alerts
 
 
-def parse_missing_alert(alert: dict[str, Any]) -> dict[str, Any] | None:
-    if alert.get("type") != "Missing":
-        return None
-    match = re.search(r"has\s+([\d,]+)\s+\(([\d\.]+)%\)\s+missing values", alert["message"])
-    if not match:
-        return None
+def build_missing_alert(alert: dict[str, Any], match: re.Match[str]) -> dict[str, Any]:
     return {
         "feature": alert["feature"],
-        "missing_count": parse_int(match.group(1)),
-        "missing_pct": parse_float(match.group(2)),
+        "missing_count": parse_int(match.group("count")),
+        "missing_pct": parse_float(match.group("pct")),
         "message": alert["message"],
     }
 
 
-def parse_zero_alert(alert: dict[str, Any]) -> dict[str, Any] | None:
-    if alert.get("type") != "Zeros":
-        return None
-    match = re.search(r"has\s+([\d,]+)\s+\(([\d\.]+)%\)\s+zeros", alert["message"])
-    if not match:
-        return None
+def build_zero_alert(alert: dict[str, Any], match: re.Match[str]) -> dict[str, Any]:
     return {
         "feature": alert["feature"],
-        "zero_count": parse_int(match.group(1)),
-        "zero_pct": parse_float(match.group(2)),
+        "zero_count": parse_int(match.group("count")),
+        "zero_pct": parse_float(match.group("pct")),
         "message": alert["message"],
     }
 
 
-def parse_imbalance_alert(alert: dict[str, Any]) -> dict[str, Any] | None:
-    if alert.get("type") != "Imbalance":
-        return None
-    match = re.search(r"\(([\d\.]+)%\)", alert["message"])
-    if not match:
-        return None
+def build_imbalance_alert(alert: dict[str, Any], match: re.Match[str]) -> dict[str, Any]:
     return {
         "feature": alert["feature"],
-        "dominant_pct": parse_float(match.group(1)),
+        "dominant_pct": parse_float(match.group("pct")),
         "message": alert["message"],
     }
 
 
+AlertBuilder = Callable[[dict[str, Any], re.Match[str]], dict[str, Any]]
+# alert type -> (message pattern, required "kind" group value or None, row builder)
+ALERT_HANDLERS: dict[str, tuple[re.Pattern[str], str | None, AlertBuilder]] = {
+    "Missing": (ALERT_MSG_RE, "missing values", build_missing_alert),
+    "Zeros": (ALERT_MSG_RE, "zeros", build_zero_alert),
+    "Imbalance": (IMBALANCE_ALERT_RE, None, build_imbalance_alert),
+}
+
+
+def group_alerts_by_type(alert_rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    grouped: dict[str, list[dict[str, Any]]] = {alert_type: [] for alert_type in ALERT_HANDLERS}
+    for alert in alert_rows:
+        handler = ALERT_HANDLERS.get(alert["type"])
+        if handler is None:
+            continue
+        pattern, kind, build = handler
+        match = pattern.search(alert["message"])
+        if match and (kind is None or match.group("kind") == kind):
+            grouped[alert["type"]].append(build(alert, match))
+    return grouped
+
+
 def parse_profile_report(path: Path) -> dict[str, Any]:
     text = load_text(path)
 
-    meta_date_match = re.search(r"<meta content=\"([^\"]+)\" name=date>", text)
+    meta_date_match = META_DATE_RE.search(text)
     report_date = meta_date_match.group(1) if meta_date_match else None
 
-    stats_block_match = re.search(
-        r"Dataset statistics<table class=\"table table-striped\"><tbody>(.*?)</table>",
-        text,
-        re.S,
-    )
+    stats_block_match = STATS_BLOCK_RE.search(text)
     stats_raw = parse_table_rows_from_block(stats_block_match.group(1)) if stats_block_match else {}
 
-    type_block_match = re.search(
-        r"Variable types<table class=\"table table-striped\"><tbody>(.*?)</table>",
-        text,
-        re.S,
-    )
+    type_block_match = TYPES_BLOCK_RE.search(text)
     var_types_raw = parse_table_rows_from_block(type_block_match.group(1)) if type_block_match else {}
 
-    alert_count_match = re.search(
-        r"Alerts <span class=\"badge text-bg-secondary align-text-top\">(\d+)</span>",
-        text,
-    )
+    alert_count_match = ALERT_COUNT_RE.search(text)
     alert_count = int(alert_count_match.group(1)) if alert_count_match else 0
 
-    alert_table_match = re.search(
-        r"<p class=\"h4 item-header\">Alerts</p>(.*?)</table></div></div></div><div class=\"tab-pane fade\" aria-labelledby=tab-pane-overview-reproduction",
-        text,
-        re.S,
-    )
+    alert_table_match = ALERT_TABLE_RE.search(text)
     alert_rows = parse_alert_rows(alert_table_match.group(1)) if alert_table_match else []
     alert_type_counts = dict(Counter(alert["type"] for alert in alert_rows))
 
-    missing_alerts = [row for row in (parse_missing_alert(a) for a in alert_rows) if row]
+    grouped_alerts = group_alerts_by_type(alert_rows)
+
+    missing_alerts = grouped_alerts["Missing"]
     missing_alerts.sort(key=lambda row: row["missing_pct"], reverse=True)
 
-    zero_alerts = [row for row in (parse_zero_alert(a) for a in alert_rows) if row]
+    zero_alerts = grouped_alerts["Zeros"]
     zero_alerts.sort(key=lambda row: row["zero_pct"], reverse=True)
 
-    imbalance_alerts = [row for row in (parse_imbalance_alert(a) for a in alert_rows) if row]
+    imbalance_alerts = grouped_alerts["Imbalance"]
     imbalance_alerts.sort(key=lambda row: row["dominant_pct"], reverse=True)
 
     profile_summary = {
-        "number_of_variables": parse_number(stats_raw.get("number_of_variables", "")),
-        "number_of_observations": parse_number(stats_raw.get("number_of_observations", "")),
-        "missing_cells": parse_number(stats_raw.get("missing_cells", "")),
+        "number_of_variables": parse_count(stats_raw.get("number_of_variables", "")),
+        "number_of_observations": parse_count(stats_raw.get("number_of_observations", "")),
+        "missing_cells": parse_count(stats_raw.get("missing_cells", "")),
         "missing_cells_pct": parse_number(stats_raw.get("missing_cells_pct", "").replace("%", "")),
         "total_memory_size_text": stats_raw.get("total_size_in_memory"),
         "total_memory_size_bytes": parse_size_to_bytes(stats_raw.get("total_size_in_memory", "")),
@@ -449,9 +593,9 @@ def parse_profile_report(path: Path) -> dict[str, Any]:
         ),
     }
     variable_types = {
-        "numeric": parse_number(var_types_raw.get("numeric", "")),
-        "categorical": parse_number(var_types_raw.get("categorical", "")),
-        "boolean": parse_number(var_types_raw.get("boolean", "")),
+        "numeric": parse_count(var_types_raw.get("numeric", "")),
+        "categorical": parse_count(var_types_raw.get("categorical", "")),
+        "boolean": parse_count(var_types_raw.get("boolean", "")),
     }
 
     return {
@@ -471,19 +615,21 @@ def parse_profile_report(path: Path) -> dict[str, Any]:
 
 
 def build_metrics(
-    nb: dict[str, Any], chart_files: dict[str, str], profile_report: dict[str, Any] | None
+    cells: dict[int, dict[str, Any]],
+    chart_files: dict[str, str],
+    profile_report: dict[str, Any] | None,
 ) -> dict[str, Any]:
-    shape_text = get_stream_text(get_cell(nb, 7))
-    feature_count_text = get_stream_text(get_cell(nb, 11))
-    target_text = get_stream_text(get_cell(nb, 13))
-    iqr_bounds_text = get_stream_text(get_cell(nb, 21))
-    iqr_rows_text = get_stream_text(get_cell(nb, 23))
-
-    top_corr_text = get_first_text_plain(get_cell(nb, 33))
-    top_driver_text = get_first_text_plain(get_cell(nb, 35))
-    top_neigh_text = get_first_text_plain(get_cell(nb, 46))
-    top_neigh_single_text = get_first_text_plain(get_cell(nb, 47))
-    missing_text = get_first_text_plain(get_cell(nb, 27))
+    shape_text = get_stream_text(get_cell(cells, 7))
+    feature_count_text = get_stream_text(get_cell(cells, 11))
+    target_text = get_stream_text(get_cell(cells, 13))
+    iqr_bounds_text = get_stream_text(get_cell(cells, 21))
+    iqr_rows_text = get_stream_text(get_cell(cells, 23))
+
+    top_corr_text = get_first_text_plain(get_cell(cells, 33))
+    top_driver_text = get_first_text_plain(get_cell(cells, 35))
+    top_neigh_text = get_first_text_plain(get_cell(cells, 46))
+    top_neigh_single_text = get_first_text_plain(get_cell(cells, 47))
+    missing_text = get_first_text_plain(get_cell(cells, 27))
 
     total_rows, total_columns = parse_shape(shape_text)
     numeric_features, categorical_features = parse_feature_counts(feature_count_text)
@@ -558,16 +704,20 @@ def build_metrics(
     return metrics
 
 
+def dump_metrics(metrics: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(metrics, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def write_metrics(metrics: dict[str, Any]) -> None:
+    payload = dump_metrics(metrics)
+
     json_path = DATA_DIR / "metrics.json"
-    with json_path.open("w", encoding="utf-8") as file:
-        json.dump(metrics, file, indent=2)
+    json_path.write_bytes(payload)
 
     js_path = JS_DIR / "metrics.js"
-    with js_path.open("w", encoding="utf-8") as file:
-        file.write("window.dashboardMetrics = ")
-        file.write(json.dumps(metrics, indent=2))
-        file.write(";\n")
+    js_path.write_bytes(b"window.dashboardMetrics = " + payload + b";\n")
 
 
 def main() -> None:
@@ -575,15 +725,15 @@ def main() -> None:
         raise FileNotFoundError(f"Notebook not found: {NOTEBOOK_PATH}")
 
     ensure_dirs()
-    notebook = load_notebook(NOTEBOOK_PATH)
-    chart_files = export_charts(notebook)
+    cells = load_notebook_cells(NOTEBOOK_PATH, WANTED_CELL_INDICES)
+    chart_files = export_charts(cells)
 
     profile_report = None
     profile_path = find_profile_path()
     if profile_path:
         profile_report = parse_profile_report(profile_path)
 
-    metrics = build_metrics(notebook, chart_files, profile_report)
+    metrics = build_metrics(cells, chart_files, profile_report)
     write_metrics(metrics)
 
     print("Dashboard assets generated from notebook/profile outputs:")
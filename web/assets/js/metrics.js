@@ -1,6 +1,6 @@
 window.dashboardMetrics = {
   "meta": {
-    "generated_at_utc": "2026-02-21T15:26:30.558663+00:00",
+    "generated_at_utc": "2026-10-15T00:33:56.531586+00:00",
     "source_notebook": "House-Price.ipynb",
     "source_note": "Values and chart outputs extracted from executed notebook cells.",
     "source_profile": "ames_house_prices_profile.html"
@@ -748,7 +748,7 @@ window.dashboardMetrics = {
       },
       {
         "feature": "MiscVal",
-        "message": "is highly skewed (\u03b31 = 24.47679419)",
+        "message": "is highly skewed (γ1 = 24.47679419)",
         "type": "Skewed"
       },
       {